@@ -562,7 +562,7 @@ def bfs_filter_subsets(
 
         Visits parents before children.
         """
-        from .asset_graph_subset import AssetGraphSubset
+        from .asset_graph_subset import AssetGraphSubset, AssetGraphSubsetBuilder
 
         all_assets = set(initial_subset.asset_keys)
         check.invariant(
@@ -578,18 +578,22 @@ def bfs_filter_subsets(
                 else None
             ),
         }
-        result = AssetGraphSubset()
+        result_builder = AssetGraphSubsetBuilder()
 
         while len(queue) > 0:
             asset_key = queue.popleft()
             partitions_subset = queued_subsets_by_asset_key.get(asset_key)
 
             if condition_fn(asset_key, partitions_subset):
-                result |= AssetGraphSubset(
-                    non_partitioned_asset_keys={asset_key} if partitions_subset is None else set(),
-                    partitions_subsets_by_asset_key=(
-                        {asset_key: partitions_subset} if partitions_subset is not None else {}
-                    ),
+                result_builder.union_inplace(
+                    AssetGraphSubset(
+                        non_partitioned_asset_keys=(
+                            {asset_key} if partitions_subset is None else set()
+                        ),
+                        partitions_subsets_by_asset_key=(
+                            {asset_key: partitions_subset} if partitions_subset is not None else {}
+                        ),
+                    )
                 )
 
                 for child in self.get_children(asset_key):
@@ -628,7 +632,7 @@ def bfs_filter_subsets(
                         queue.append(child)
                         all_assets.add(child)
 
-        return result
+        return result_builder.build()
 
     def bfs_filter_asset_partitions(
         self,
@@ -1,12 +1,12 @@
-import operator
 from collections import defaultdict
 from datetime import datetime
+from functools import cached_property, lru_cache
 from typing import (
     AbstractSet,
     Any,
-    Callable,
     Dict,
     Iterable,
+    List,
     Mapping,
     NamedTuple,
     Optional,
@@ -36,54 +36,145 @@
 
 
 class PartitionsSubsetMappingNamedTupleSerializer(NamedTupleSerializer):
-    """Serializes NamedTuples with fields that are mappings containing PartitionsSubsets.
+    """Serializes AssetGraphSubsets, whose partitions_subsets_by_asset_key mapping contains
+    PartitionsSubsets.
 
     This is necessary because PartitionKeysTimeWindowPartitionsSubsets are not serializable,
     so we convert them to TimeWindowPartitionsSubsets.
     """
 
-    def before_pack(self, value: NamedTuple) -> NamedTuple:
-        replaced_value_by_field_name = {}
-        for field_name, field_value in value._asdict().items():
-            if isinstance(field_value, Mapping) and all(
-                isinstance(v, PartitionsSubset) for v in field_value.values()
-            ):
-                # PartitionKeysTimeWindowPartitionsSubsets are not serializable, so
-                # we convert them to TimeWindowPartitionsSubsets
-                subsets_by_key = {
-                    k: v.to_time_window_partitions_subset()
-                    if isinstance(v, PartitionKeysTimeWindowPartitionsSubset)
-                    else v
-                    for k, v in field_value.items()
-                }
-
-                # If the mapping is keyed by AssetKey wrap it in a SerializableNonScalarKeyMapping
-                # so it can be serialized. This can be expanded to other key types in the future.
-                if all(isinstance(k, AssetKey) for k in subsets_by_key.keys()):
-                    replaced_value_by_field_name[field_name] = SerializableNonScalarKeyMapping(
-                        subsets_by_key
-                    )
+    def before_pack(self, value: "AssetGraphSubset") -> "AssetGraphSubset":
+        subsets_by_asset_key = value.partitions_subsets_by_asset_key
+        # Whether any subsets need converting is memoized on the (immutable) instance
+        if value._has_partition_keys_time_window_subsets:  # noqa: SLF001
+            subsets_by_asset_key = {
+                k: v.to_time_window_partitions_subset()
+                if isinstance(v, PartitionKeysTimeWindowPartitionsSubset)
+                else v
+                for k, v in subsets_by_asset_key.items()
+            }
+
+        # The mapping is keyed by AssetKey, so wrap it in a SerializableNonScalarKeyMapping so it
+        # can be serialized
+        return value._replace(
+            partitions_subsets_by_asset_key=SerializableNonScalarKeyMapping(subsets_by_asset_key)
+        )
 
-        return value._replace(**replaced_value_by_field_name)
+
+# Stored subsets are typically checked with can_deserialize and then loaded with from_storage_dict,
+# often several at a time for the same set of assets, so the same asset key strings get parsed
+# repeatedly. AssetKeys are immutable, so the parsed keys can be shared.
+@lru_cache(maxsize=4096)
+def _asset_key_from_user_string(asset_key_string: str) -> AssetKey:
+    return AssetKey.from_user_string(asset_key_string)
+
+
+def _has_no_entries(asset_graph_subset: "AssetGraphSubset") -> bool:
+    return (
+        not asset_graph_subset.partitions_subsets_by_asset_key
+        and not asset_graph_subset.non_partitioned_asset_keys
+    )
+
+
+def _check_partitioning_consistent(
+    partitions_subsets_by_asset_key: Mapping[AssetKey, PartitionsSubset],
+    non_partitioned_asset_keys: AbstractSet[AssetKey],
+    other: "AssetGraphSubset",
+) -> None:
+    # An asset key must be either partitioned or non-partitioned in both subsets. Checked once
+    # up front against the whole key sets rather than per key inside the merge loops.
+    # set.isdisjoint walks a dict argument in full, so the mapping is compared through its keys
+    # view, which only iterates the smaller operand.
+    check.invariant(non_partitioned_asset_keys.isdisjoint(other.partitions_subsets_by_asset_key))
+    check.invariant(
+        partitions_subsets_by_asset_key.keys().isdisjoint(other.non_partitioned_asset_keys)
+    )
+
+
+def _union_partitions_subsets_into(
+    result_subsets_by_asset_key: Dict[AssetKey, PartitionsSubset],
+    subsets_by_asset_key: Mapping[AssetKey, PartitionsSubset],
+    other_subsets_by_asset_key: Mapping[AssetKey, PartitionsSubset],
+) -> None:
+    """For each asset key in other_subsets_by_asset_key, stores the union of its subsets from
+    subsets_by_asset_key and other_subsets_by_asset_key in result_subsets_by_asset_key, which may be
+    subsets_by_asset_key itself. The union of non-empty subsets is never empty.
+    """
+    get_subset = subsets_by_asset_key.get
+    for asset_key, other_subset in other_subsets_by_asset_key.items():
+        subset = get_subset(asset_key)
+        result_subsets_by_asset_key[asset_key] = (
+            other_subset if subset is None else subset | other_subset
+        )
 
 
 @whitelist_for_serdes(serializer=PartitionsSubsetMappingNamedTupleSerializer)
-class AssetGraphSubset(NamedTuple):
-    partitions_subsets_by_asset_key: Mapping[AssetKey, PartitionsSubset] = {}
-    non_partitioned_asset_keys: AbstractSet[AssetKey] = set()
+class AssetGraphSubset(
+    NamedTuple(
+        "_AssetGraphSubset",
+        [
+            ("partitions_subsets_by_asset_key", Mapping[AssetKey, PartitionsSubset]),
+            ("non_partitioned_asset_keys", AbstractSet[AssetKey]),
+        ],
+    )
+):
+    """A set of asset partitions within an AssetGraph.
+
+    Invariant: partitions_subsets_by_asset_key never contains an empty PartitionsSubset. Empty
+    subsets passed to the constructor are dropped, so every key in the mapping has at least one
+    partition in the subset.
+    """
 
-    @property
+    def __new__(
+        cls,
+        partitions_subsets_by_asset_key: Optional[Mapping[AssetKey, PartitionsSubset]] = None,
+        non_partitioned_asset_keys: Optional[AbstractSet[AssetKey]] = None,
+    ):
+        return cls._from_non_empty_subsets(
+            partitions_subsets_by_asset_key={
+                asset_key: subset
+                for asset_key, subset in (partitions_subsets_by_asset_key or {}).items()
+                if not subset.is_empty
+            },
+            non_partitioned_asset_keys=non_partitioned_asset_keys or set(),
+        )
+
+    @classmethod
+    def _from_non_empty_subsets(
+        cls,
+        partitions_subsets_by_asset_key: Mapping[AssetKey, PartitionsSubset],
+        non_partitioned_asset_keys: AbstractSet[AssetKey],
+    ) -> "AssetGraphSubset":
+        """Constructs an AssetGraphSubset without dropping empty PartitionsSubsets, for callers that
+        already guarantee that none of the given subsets are empty.
+        """
+        return super(AssetGraphSubset, cls).__new__(
+            cls,
+            partitions_subsets_by_asset_key=partitions_subsets_by_asset_key,
+            non_partitioned_asset_keys=non_partitioned_asset_keys,
+        )
+
+    # AssetGraphSubsets are immutable, so properties derived from the fields are computed at most
+    # once per instance
+    @cached_property
     def asset_keys(self) -> AbstractSet[AssetKey]:
-        return {
-            key for key, subset in self.partitions_subsets_by_asset_key.items() if len(subset) > 0
-        } | self.non_partitioned_asset_keys
+        return self.partitions_subsets_by_asset_key.keys() | self.non_partitioned_asset_keys
 
-    @property
+    @cached_property
     def num_partitions_and_non_partitioned_assets(self):
         return len(self.non_partitioned_asset_keys) + sum(
             len(subset) for subset in self.partitions_subsets_by_asset_key.values()
         )
 
+    @cached_property
+    def _has_partition_keys_time_window_subsets(self) -> bool:
+        # PartitionKeysTimeWindowPartitionsSubsets are not serializable, so
+        # PartitionsSubsetMappingNamedTupleSerializer must convert them before packing
+        return any(
+            isinstance(subset, PartitionKeysTimeWindowPartitionsSubset)
+            for subset in self.partitions_subsets_by_asset_key.values()
+        )
+
     def get_partitions_subset(
         self, asset_key: AssetKey, asset_graph: Optional[AssetGraph] = None
     ) -> PartitionsSubset:
@@ -99,15 +190,15 @@ def get_partitions_subset(
             return self.partitions_subsets_by_asset_key[asset_key]
 
     def iterate_asset_partitions(self) -> Iterable[AssetKeyPartitionKey]:
-        for (
-            asset_key,
-            partitions_subset,
-        ) in self.partitions_subsets_by_asset_key.items():
-            for partition_key in partitions_subset.get_partition_keys():
-                yield AssetKeyPartitionKey(asset_key, partition_key)
+        for asset_key, partitions_subset in self.partitions_subsets_by_asset_key.items():
+            yield from (
+                AssetKeyPartitionKey(asset_key, partition_key)
+                for partition_key in partitions_subset.get_partition_keys()
+            )
 
-        for asset_key in self.non_partitioned_asset_keys:
-            yield AssetKeyPartitionKey(asset_key, None)
+        yield from (
+            AssetKeyPartitionKey(asset_key, None) for asset_key in self.non_partitioned_asset_keys
+        )
 
     def __contains__(self, asset: Union[AssetKey, AssetKeyPartitionKey]) -> bool:
         """If asset is an AssetKeyPartitionKey, check if the given AssetKeyPartitionKey is in the
@@ -115,10 +206,10 @@ def __contains__(self, asset: Union[AssetKey, AssetKeyPartitionKey]) -> bool:
         the subset.
         """
         if isinstance(asset, AssetKey):
-            # check if any keys are in the subset
-            partitions_subset = self.partitions_subsets_by_asset_key.get(asset)
-            return (partitions_subset is not None and len(partitions_subset) > 0) or (
-                asset in self.non_partitioned_asset_keys
+            # check if any keys are in the subset. Only non-empty partitions subsets are stored.
+            return (
+                asset in self.partitions_subsets_by_asset_key
+                or asset in self.non_partitioned_asset_keys
             )
         elif asset.partition_key is None:
             return asset.asset_key in self.non_partitioned_asset_keys
@@ -129,85 +220,167 @@ def __contains__(self, asset: Union[AssetKey, AssetKeyPartitionKey]) -> bool:
     def to_storage_dict(
         self, dynamic_partitions_store: DynamicPartitionsStore, asset_graph: AssetGraph
     ) -> Mapping[str, object]:
-        return {
-            "partitions_subsets_by_asset_key": {
-                key.to_user_string(): value.serialize()
-                for key, value in self.partitions_subsets_by_asset_key.items()
-            },
-            "serializable_partitions_def_ids_by_asset_key": {
-                key.to_user_string(): check.not_none(
-                    asset_graph.get_partitions_def(key)
-                ).get_serializable_unique_identifier(
+        serialized_subsets_by_asset_key: Dict[str, str] = {}
+        serializable_partitions_def_ids_by_asset_key: Dict[str, str] = {}
+        partitions_def_class_names_by_asset_key: Dict[str, str] = {}
+        # Many assets typically share the same PartitionsDefinition, and computing its unique
+        # identifier can be expensive (e.g. it lists every partition key of a dynamic partitions
+        # definition), so it is computed once per PartitionsDefinition instance
+        serializable_ids_by_partitions_def_id: Dict[int, str] = {}
+        # Resolve the methods called for every asset key once, outside of the loop
+        to_user_string = AssetKey.to_user_string
+        get_partitions_def = asset_graph.get_partitions_def
+        for key, value in self.partitions_subsets_by_asset_key.items():
+            key_str = to_user_string(key)
+            partitions_def = check.not_none(get_partitions_def(key))
+
+            serializable_id = serializable_ids_by_partitions_def_id.get(id(partitions_def))
+            if serializable_id is None:
+                serializable_id = partitions_def.get_serializable_unique_identifier(
                     dynamic_partitions_store=dynamic_partitions_store
                 )
-                for key, _ in self.partitions_subsets_by_asset_key.items()
-            },
-            "partitions_def_class_names_by_asset_key": {
-                key.to_user_string(): check.not_none(
-                    asset_graph.get_partitions_def(key)
-                ).__class__.__name__
-                for key, _ in self.partitions_subsets_by_asset_key.items()
-            },
-            "non_partitioned_asset_keys": [
-                key.to_user_string() for key in self.non_partitioned_asset_keys
-            ],
+                serializable_ids_by_partitions_def_id[id(partitions_def)] = serializable_id
+
+            serialized_subsets_by_asset_key[key_str] = value.serialize()
+            serializable_partitions_def_ids_by_asset_key[key_str] = serializable_id
+            partitions_def_class_names_by_asset_key[key_str] = partitions_def.__class__.__name__
+
+        return {
+            "partitions_subsets_by_asset_key": serialized_subsets_by_asset_key,
+            "serializable_partitions_def_ids_by_asset_key": (
+                serializable_partitions_def_ids_by_asset_key
+            ),
+            "partitions_def_class_names_by_asset_key": partitions_def_class_names_by_asset_key,
+            "non_partitioned_asset_keys": list(
+                map(to_user_string, self.non_partitioned_asset_keys)
+            ),
         }
 
-    def _oper(self, other: "AssetGraphSubset", oper: Callable) -> "AssetGraphSubset":
-        """Returns the AssetGraphSubset that results from applying the given operator to the set of
-        asset partitions in self and other.
+    # AssetGraphSubsets are immutable, so the operators below return an existing instance when an
+    # operand is empty, and only copy self's mapping and set when other can change them. They drop
+    # empty results themselves and bypass the filtering done in __new__.
+
+    def _union(self, other: "AssetGraphSubset") -> "AssetGraphSubset":
+        if _has_no_entries(other):
+            return self
+        if _has_no_entries(self):
+            return other
+        _check_partitioning_consistent(
+            self.partitions_subsets_by_asset_key, self.non_partitioned_asset_keys, other
+        )
 
-        Note: Not all operators are supported on the underlying PartitionsSubset objects.
-        """
-        result_partition_subsets_by_asset_key = {**self.partitions_subsets_by_asset_key}
-        result_non_partitioned_asset_keys = set(self.non_partitioned_asset_keys)
-
-        for asset_key in other.asset_keys:
-            if asset_key in other.non_partitioned_asset_keys:
-                check.invariant(asset_key not in self.partitions_subsets_by_asset_key)
-                result_non_partitioned_asset_keys = oper(
-                    result_non_partitioned_asset_keys, {asset_key}
-                )
-            else:
-                check.invariant(asset_key not in self.non_partitioned_asset_keys)
-                subset = (
-                    self.get_partitions_subset(asset_key)
-                    if asset_key in self.partitions_subsets_by_asset_key
-                    else None
-                )
+        changed_subsets_by_asset_key: Dict[AssetKey, PartitionsSubset] = {}
+        _union_partitions_subsets_into(
+            changed_subsets_by_asset_key,
+            self.partitions_subsets_by_asset_key,
+            other.partitions_subsets_by_asset_key,
+        )
 
-                other_subset = other.get_partitions_subset(asset_key)
+        return self._from_non_empty_subsets(
+            partitions_subsets_by_asset_key=(
+                {**self.partitions_subsets_by_asset_key, **changed_subsets_by_asset_key}
+                if changed_subsets_by_asset_key
+                else self.partitions_subsets_by_asset_key
+            ),
+            non_partitioned_asset_keys=(
+                self.non_partitioned_asset_keys | other.non_partitioned_asset_keys
+                if other.non_partitioned_asset_keys
+                else self.non_partitioned_asset_keys
+            ),
+        )
 
-                if other_subset is not None and subset is not None:
-                    result_partition_subsets_by_asset_key[asset_key] = oper(subset, other_subset)
+    def _difference(self, other: "AssetGraphSubset") -> "AssetGraphSubset":
+        if _has_no_entries(self) or _has_no_entries(other):
+            return self
+        _check_partitioning_consistent(
+            self.partitions_subsets_by_asset_key, self.non_partitioned_asset_keys, other
+        )
 
-                # Special case operations if either subset is None
-                if subset is None and other_subset is not None and oper == operator.or_:
-                    result_partition_subsets_by_asset_key[asset_key] = other_subset
-                elif subset is not None and other_subset is None and oper == operator.and_:
+        changed_subsets_by_asset_key: Dict[AssetKey, PartitionsSubset] = {}
+        get_subset = self.partitions_subsets_by_asset_key.get
+        for asset_key, other_subset in other.partitions_subsets_by_asset_key.items():
+            subset = get_subset(asset_key)
+            if subset is not None:
+                changed_subsets_by_asset_key[asset_key] = subset - other_subset
+
+        result_partition_subsets_by_asset_key = self.partitions_subsets_by_asset_key
+        if changed_subsets_by_asset_key:
+            result_partition_subsets_by_asset_key = {
+                **self.partitions_subsets_by_asset_key,
+                **changed_subsets_by_asset_key,
+            }
+            for asset_key, subset in changed_subsets_by_asset_key.items():
+                if subset.is_empty:
                     del result_partition_subsets_by_asset_key[asset_key]
 
-        return AssetGraphSubset(
+        return self._from_non_empty_subsets(
             partitions_subsets_by_asset_key=result_partition_subsets_by_asset_key,
-            non_partitioned_asset_keys=result_non_partitioned_asset_keys,
+            non_partitioned_asset_keys=(
+                self.non_partitioned_asset_keys - other.non_partitioned_asset_keys
+                if self.non_partitioned_asset_keys and other.non_partitioned_asset_keys
+                else self.non_partitioned_asset_keys
+            ),
+        )
+
+    def _intersection(self, other: "AssetGraphSubset") -> "AssetGraphSubset":
+        if _has_no_entries(self):
+            return self
+        if _has_no_entries(other):
+            return AssetGraphSubset()
+        _check_partitioning_consistent(
+            self.partitions_subsets_by_asset_key, self.non_partitioned_asset_keys, other
+        )
+
+        # Asset keys that only have partitions in one of the operands are not part of the
+        # intersection, so only the shared keys are visited
+        result_partition_subsets_by_asset_key: Dict[AssetKey, PartitionsSubset] = {}
+        get_subset = self.partitions_subsets_by_asset_key.get
+        for asset_key, other_subset in other.partitions_subsets_by_asset_key.items():
+            subset = get_subset(asset_key)
+            if subset is not None:
+                intersection = subset & other_subset
+                if not intersection.is_empty:
+                    result_partition_subsets_by_asset_key[asset_key] = intersection
+
+        return self._from_non_empty_subsets(
+            partitions_subsets_by_asset_key=result_partition_subsets_by_asset_key,
+            non_partitioned_asset_keys=self.non_partitioned_asset_keys
+            & other.non_partitioned_asset_keys,
         )
 
     def __or__(self, other: "AssetGraphSubset") -> "AssetGraphSubset":
-        return self._oper(other, operator.or_)
+        return self._union(other)
 
     def __sub__(self, other: "AssetGraphSubset") -> "AssetGraphSubset":
-        return self._oper(other, operator.sub)
+        return self._difference(other)
 
     def __and__(self, other: "AssetGraphSubset") -> "AssetGraphSubset":
-        return self._oper(other, operator.and_)
+        return self._intersection(other)
 
     def filter_asset_keys(self, asset_keys: AbstractSet[AssetKey]) -> "AssetGraphSubset":
-        return AssetGraphSubset(
-            partitions_subsets_by_asset_key={
+        subsets_by_asset_key = self.partitions_subsets_by_asset_key
+        # Callers often filter down to a handful of keys, in which case probing the mapping for
+        # each of them is cheaper than scanning all of it. The result keeps self's key order, so
+        # the mapping is still scanned if more than one of the probed keys is retained.
+        retained_asset_keys: Optional[List[AssetKey]] = None
+        if len(asset_keys) < len(subsets_by_asset_key):
+            retained_asset_keys = [
+                asset_key for asset_key in asset_keys if asset_key in subsets_by_asset_key
+            ]
+
+        if retained_asset_keys is not None and len(retained_asset_keys) <= 1:
+            partitions_subsets_by_asset_key = {
+                asset_key: subsets_by_asset_key[asset_key] for asset_key in retained_asset_keys
+            }
+        else:
+            partitions_subsets_by_asset_key = {
                 asset_key: subset
-                for asset_key, subset in self.partitions_subsets_by_asset_key.items()
+                for asset_key, subset in subsets_by_asset_key.items()
                 if asset_key in asset_keys
-            },
+            }
+
+        return self._from_non_empty_subsets(
+            partitions_subsets_by_asset_key=partitions_subsets_by_asset_key,
             non_partitioned_asset_keys=self.non_partitioned_asset_keys & asset_keys,
         )
 
@@ -232,21 +405,22 @@ def from_asset_partition_set(
         asset_partitions_set: AbstractSet[AssetKeyPartitionKey],
         asset_graph: AssetGraph,
     ) -> "AssetGraphSubset":
-        partitions_by_asset_key = defaultdict(set)
+        # The pairs in asset_partitions_set are unique, so the partition keys for each asset key can
+        # be collected in lists and passed to a single with_partition_keys call
+        partitions_by_asset_key: Dict[AssetKey, List[str]] = defaultdict(list)
         non_partitioned_asset_keys = set()
         for asset_key, partition_key in asset_partitions_set:
             if partition_key is not None:
-                partitions_by_asset_key[asset_key].add(partition_key)
+                partitions_by_asset_key[asset_key].append(partition_key)
             else:
                 non_partitioned_asset_keys.add(asset_key)
 
-        return AssetGraphSubset(
+        # Every asset key has at least one partition key, so none of the subsets are empty
+        return cls._from_non_empty_subsets(
             partitions_subsets_by_asset_key={
-                asset_key: (
-                    cast(PartitionsDefinition, asset_graph.get_partitions_def(asset_key))
-                    .empty_subset()
-                    .with_partition_keys(partition_keys)
-                )
+                asset_key: cast(
+                    PartitionsDefinition, asset_graph.get_partitions_def(asset_key)
+                ).subset_with_partition_keys(partition_keys)
                 for asset_key, partition_keys in partitions_by_asset_key.items()
             },
             non_partitioned_asset_keys=non_partitioned_asset_keys,
@@ -263,7 +437,7 @@ def can_deserialize(cls, serialized_dict: Mapping[str, Any], asset_graph: AssetG
         )
 
         for key, value in serialized_dict["partitions_subsets_by_asset_key"].items():
-            asset_key = AssetKey.from_user_string(key)
+            asset_key = _asset_key_from_user_string(key)
             partitions_def = asset_graph.get_partitions_def(asset_key)
 
             if partitions_def is None:
@@ -295,18 +469,21 @@ def from_storage_dict(
         partitions_def_class_names_by_asset_key = serialized_dict.get(
             "partitions_def_class_names_by_asset_key", {}
         )
+        # AssetGraph.all_asset_keys builds a new set on every access
+        all_asset_keys = asset_graph.all_asset_keys
+        get_partitions_def = asset_graph.get_partitions_def
         partitions_subsets_by_asset_key: Dict[AssetKey, PartitionsSubset] = {}
         for key, value in serialized_dict["partitions_subsets_by_asset_key"].items():
-            asset_key = AssetKey.from_user_string(key)
+            asset_key = _asset_key_from_user_string(key)
 
-            if asset_key not in asset_graph.all_asset_keys:
+            if asset_key not in all_asset_keys:
                 if not allow_partial:
                     raise DagsterDefinitionChangedDeserializationError(
                         f"Asset {key} existed at storage-time, but no longer does"
                     )
                 continue
 
-            partitions_def = asset_graph.get_partitions_def(asset_key)
+            partitions_def = get_partitions_def(asset_key)
 
             if partitions_def is None:
                 if not allow_partial:
@@ -331,13 +508,16 @@ def from_storage_dict(
                     )
                 continue
 
-            partitions_subsets_by_asset_key[asset_key] = partitions_def.deserialize_subset(value)
+            partitions_subset = partitions_def.deserialize_subset(value)
+            if not partitions_subset.is_empty:
+                partitions_subsets_by_asset_key[asset_key] = partitions_subset
 
         non_partitioned_asset_keys = {
-            AssetKey.from_user_string(key) for key in serialized_dict["non_partitioned_asset_keys"]
-        } & asset_graph.all_asset_keys
+            _asset_key_from_user_string(key)
+            for key in serialized_dict["non_partitioned_asset_keys"]
+        } & all_asset_keys
 
-        return AssetGraphSubset(
+        return cls._from_non_empty_subsets(
             partitions_subsets_by_asset_key=partitions_subsets_by_asset_key,
             non_partitioned_asset_keys=non_partitioned_asset_keys,
         )
@@ -364,24 +544,76 @@ def from_asset_keys(
         dynamic_partitions_store: DynamicPartitionsStore,
         current_time: datetime,
     ) -> "AssetGraphSubset":
+        get_partitions_def = asset_graph.get_partitions_def
         partitions_subsets_by_asset_key: Dict[AssetKey, PartitionsSubset] = {}
         non_partitioned_asset_keys: Set[AssetKey] = set()
 
         for asset_key in asset_keys:
-            partitions_def = asset_graph.get_partitions_def(asset_key)
+            partitions_def = get_partitions_def(asset_key)
             if partitions_def:
-                partitions_subsets_by_asset_key[
-                    asset_key
-                ] = partitions_def.empty_subset().with_partition_keys(
-                    partitions_def.get_partition_keys(
-                        dynamic_partitions_store=dynamic_partitions_store,
-                        current_time=current_time,
-                    )
+                partition_keys = partitions_def.get_partition_keys(
+                    dynamic_partitions_store=dynamic_partitions_store,
+                    current_time=current_time,
                 )
+                if partition_keys:
+                    partitions_subsets_by_asset_key[
+                        asset_key
+                    ] = partitions_def.empty_subset().with_partition_keys(partition_keys)
             else:
                 non_partitioned_asset_keys.add(asset_key)
 
-        return AssetGraphSubset(
+        return cls._from_non_empty_subsets(
             partitions_subsets_by_asset_key=partitions_subsets_by_asset_key,
             non_partitioned_asset_keys=non_partitioned_asset_keys,
         )
+
+
+class AssetGraphSubsetBuilder:
+    """Accumulates the union of many AssetGraphSubsets.
+
+    Chaining `result = result | subset` copies the accumulated mapping and set on every step, which
+    is quadratic in the number of accumulated assets. The builder instead merges each subset into a
+    mutable mapping and set, and build() wraps them in an AssetGraphSubset without copying.
+    """
+
+    def __init__(
+        self,
+        partitions_subsets_by_asset_key: Optional[Mapping[AssetKey, PartitionsSubset]] = None,
+        non_partitioned_asset_keys: Optional[AbstractSet[AssetKey]] = None,
+    ) -> None:
+        # Empty subsets are dropped, as in AssetGraphSubset.__new__
+        self._partitions_subsets_by_asset_key: Dict[AssetKey, PartitionsSubset] = {
+            asset_key: subset
+            for asset_key, subset in (partitions_subsets_by_asset_key or {}).items()
+            if not subset.is_empty
+        }
+        self._non_partitioned_asset_keys: Set[AssetKey] = set(non_partitioned_asset_keys or ())
+        # Whether the current mapping and set are shared with a built AssetGraphSubset, in which
+        # case they are copied before being mutated again
+        self._is_shared = False
+
+    def union_inplace(self, other: AssetGraphSubset) -> None:
+        if _has_no_entries(other):
+            return
+
+        if self._is_shared:
+            self._partitions_subsets_by_asset_key = dict(self._partitions_subsets_by_asset_key)
+            self._non_partitioned_asset_keys = set(self._non_partitioned_asset_keys)
+            self._is_shared = False
+
+        _check_partitioning_consistent(
+            self._partitions_subsets_by_asset_key, self._non_partitioned_asset_keys, other
+        )
+        _union_partitions_subsets_into(
+            self._partitions_subsets_by_asset_key,
+            self._partitions_subsets_by_asset_key,
+            other.partitions_subsets_by_asset_key,
+        )
+        self._non_partitioned_asset_keys.update(other.non_partitioned_asset_keys)
+
+    def build(self) -> AssetGraphSubset:
+        self._is_shared = True
+        return AssetGraphSubset._from_non_empty_subsets(  # noqa: SLF001
+            partitions_subsets_by_asset_key=self._partitions_subsets_by_asset_key,
+            non_partitioned_asset_keys=self._non_partitioned_asset_keys,
+        )
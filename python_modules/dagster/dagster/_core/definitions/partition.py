@@ -1017,6 +1017,13 @@ def partitions_def(self) -> Optional[PartitionsDefinition[T_str]]:
     def __len__(self) -> int:
         ...
 
+    @property
+    def is_empty(self) -> bool:
+        """Whether the subset contains no partitions. Subclasses for which computing the number of
+        partitions is expensive should override this.
+        """
+        return len(self) == 0
+
     @abstractmethod
     def __contains__(self, value) -> bool:
         ...
@@ -1128,6 +1135,16 @@ def with_partition_keys(self, partition_keys: Iterable[str]) -> "DefaultPartitio
             self.subset | set(partition_keys),
         )
 
+    def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        if isinstance(other, DefaultPartitionsSubset):
+            return DefaultPartitionsSubset(self.subset | other.subset)
+        return super().__or__(other)
+
+    def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        if isinstance(other, DefaultPartitionsSubset):
+            return DefaultPartitionsSubset(self.subset & other.subset)
+        return super().__and__(other)
+
     def serialize(self) -> str:
         # Serialize version number, so attempting to deserialize old versions can be handled gracefully.
         # Any time the serialization format changes, we should increment the version number.
@@ -1281,6 +1298,15 @@ def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset":
     def __len__(self) -> int:
         return len(self.get_partition_keys())
 
+    @property
+    def is_empty(self) -> bool:
+        return (
+            self.partitions_def.get_first_partition_key(
+                self.current_time, self.dynamic_partitions_store
+            )
+            is None
+        )
+
     def __contains__(self, value) -> bool:
         return self.partitions_def.has_partition_key(
             partition_key=value,
@@ -2137,6 +2137,64 @@ def with_partitions_def(
             included_time_windows=self.included_time_windows,
         )
 
+    def _has_same_partitions_def(self, other: PartitionsSubset) -> bool:
+        return (
+            isinstance(other, TimeWindowPartitionsSubset)
+            and other.partitions_def == self.partitions_def
+        )
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        """Merges the time windows of both subsets directly when they share a partitions def, rather
+        than expanding other into partition keys.
+        """
+        if self is other or not self._has_same_partitions_def(other):
+            return super().__or__(other)
+        other = cast(TimeWindowPartitionsSubset, other)
+
+        result_windows: List[TimeWindow] = []
+        for window in sorted(
+            [*self.included_time_windows, *other.included_time_windows],
+            key=lambda tw: tw.start.timestamp(),
+        ):
+            if result_windows and window.start.timestamp() <= result_windows[-1].end.timestamp():
+                # overlaps or is adjacent to the previous window
+                if window.end.timestamp() > result_windows[-1].end.timestamp():
+                    result_windows[-1] = TimeWindow(result_windows[-1].start, window.end)
+            else:
+                result_windows.append(window)
+
+        # num_partitions is computed lazily from the merged windows if it's needed
+        return TimeWindowPartitionsSubset(
+            self.partitions_def, num_partitions=None, included_time_windows=result_windows
+        )
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        """Intersects the time windows of both subsets directly when they share a partitions def,
+        rather than expanding both into sets of partition keys.
+        """
+        if self is other or not self._has_same_partitions_def(other):
+            return super().__and__(other)
+        other = cast(TimeWindowPartitionsSubset, other)
+
+        result_windows: List[TimeWindow] = []
+        windows, other_windows = self.included_time_windows, other.included_time_windows
+        i = j = 0
+        while i < len(windows) and j < len(other_windows):
+            window, other_window = windows[i], other_windows[j]
+            start = max(window.start, other_window.start, key=lambda dt: dt.timestamp())
+            end = min(window.end, other_window.end, key=lambda dt: dt.timestamp())
+            if start.timestamp() < end.timestamp():
+                result_windows.append(TimeWindow(start, end))
+
+            if window.end.timestamp() <= other_window.end.timestamp():
+                i += 1
+            else:
+                j += 1
+
+        return TimeWindowPartitionsSubset(
+            self.partitions_def, num_partitions=None, included_time_windows=result_windows
+        )
+
     def __repr__(self) -> str:
         return f"TimeWindowPartitionsSubset({self.get_partition_key_ranges(self.partitions_def)})"
 
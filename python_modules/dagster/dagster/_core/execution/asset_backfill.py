@@ -30,7 +30,10 @@
     build_run_requests_with_backfill_policies,
 )
 from dagster._core.definitions.asset_graph import AssetGraph
-from dagster._core.definitions.asset_graph_subset import AssetGraphSubset
+from dagster._core.definitions.asset_graph_subset import (
+    AssetGraphSubset,
+    AssetGraphSubsetBuilder,
+)
 from dagster._core.definitions.asset_selection import AssetSelection
 from dagster._core.definitions.assets_job import is_base_asset_job_name
 from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
@@ -186,9 +189,10 @@ def get_target_root_asset_partitions(
         def _get_self_and_downstream_targeted_subset(
             initial_subset: AssetGraphSubset,
         ) -> AssetGraphSubset:
-            self_and_downstream = initial_subset
+            self_and_downstream_builder = AssetGraphSubsetBuilder()
+            self_and_downstream_builder.union_inplace(initial_subset)
             for asset_key in initial_subset.asset_keys:
-                self_and_downstream = self_and_downstream | (
+                self_and_downstream_builder.union_inplace(
                     instance_queryer.asset_graph.bfs_filter_subsets(
                         instance_queryer,
                         lambda asset_key, _: asset_key in self.target_subset,
@@ -197,7 +201,7 @@ def _get_self_and_downstream_targeted_subset(
                     )
                     & self.target_subset
                 )
-            return self_and_downstream
+            return self_and_downstream_builder.build()
 
         assets_with_no_parents_in_target_subset = {
             asset_key
@@ -531,18 +535,23 @@ def from_asset_partitions(
                 )
 
             root_partitions_subset = root_partitions_def.subset_with_partition_keys(partition_names)
-            target_subset = AssetGraphSubset(
+            target_subset_builder = AssetGraphSubsetBuilder(
                 non_partitioned_asset_keys=set(asset_selection) - partitioned_asset_keys,
             )
             for root_asset_key in root_partitioned_asset_keys:
-                target_subset |= asset_graph.bfs_filter_subsets(
-                    dynamic_partitions_store,
-                    lambda asset_key, _: asset_key in partitioned_asset_keys,
-                    AssetGraphSubset(
-                        partitions_subsets_by_asset_key={root_asset_key: root_partitions_subset},
-                    ),
-                    current_time=backfill_start_time,
+                target_subset_builder.union_inplace(
+                    asset_graph.bfs_filter_subsets(
+                        dynamic_partitions_store,
+                        lambda asset_key, _: asset_key in partitioned_asset_keys,
+                        AssetGraphSubset(
+                            partitions_subsets_by_asset_key={
+                                root_asset_key: root_partitions_subset
+                            },
+                        ),
+                        current_time=backfill_start_time,
+                    )
                 )
+            target_subset = target_subset_builder.build()
         else:
             check.failed("Either partition_names must not be None or all_partitions must be True")
 
@@ -1039,7 +1048,7 @@ def get_asset_backfill_iteration_materialized_partitions(
     This function is a generator so we can return control to the daemon and let it heartbeat
     during expensive operations.
     """
-    recently_materialized_asset_partitions = AssetGraphSubset()
+    recently_materialized_builder = AssetGraphSubsetBuilder()
     for asset_key in asset_backfill_data.target_subset.asset_keys:
         records = instance_queryer.instance.get_event_records(
             EventRecordsFilter(
@@ -1055,18 +1064,20 @@ def get_asset_backfill_iteration_materialized_partitions(
                 run_id=record.run_id, tag_key=BACKFILL_ID_TAG, tag_value=backfill_id
             )
         ]
-        recently_materialized_asset_partitions |= AssetGraphSubset.from_asset_partition_set(
-            {
-                AssetKeyPartitionKey(asset_key, record.partition_key)
-                for record in records_in_backfill
-            },
-            asset_graph,
+        recently_materialized_builder.union_inplace(
+            AssetGraphSubset.from_asset_partition_set(
+                {
+                    AssetKeyPartitionKey(asset_key, record.partition_key)
+                    for record in records_in_backfill
+                },
+                asset_graph,
+            )
         )
 
         yield None
 
     updated_materialized_subset = (
-        asset_backfill_data.materialized_subset | recently_materialized_asset_partitions
+        asset_backfill_data.materialized_subset | recently_materialized_builder.build()
     )
 
     yield updated_materialized_subset
@@ -18,7 +18,10 @@
 
 import dagster._check as check
 from dagster._core.definitions.asset_graph import AssetGraph
-from dagster._core.definitions.asset_graph_subset import AssetGraphSubset
+from dagster._core.definitions.asset_graph_subset import (
+    AssetGraphSubset,
+    AssetGraphSubsetBuilder,
+)
 from dagster._core.definitions.data_version import (
     DATA_VERSION_TAG,
     DataVersion,
@@ -438,7 +441,7 @@ def get_active_backfill_target_asset_graph_subset(self) -> AssetGraphSubset:
             if backfill.is_asset_backfill
         ]
 
-        result = AssetGraphSubset()
+        result_builder = AssetGraphSubsetBuilder()
         for asset_backfill in asset_backfills:
             if asset_backfill.serialized_asset_backfill_data is None:
                 check.failed("Asset backfill missing serialized_asset_backfill_data")
@@ -457,9 +460,9 @@ def get_active_backfill_target_asset_graph_subset(self) -> AssetGraphSubset:
                 # Backfill can't be loaded, so no risk of the assets interfering
                 continue
 
-            result |= asset_backfill_data.target_subset
+            result_builder.union_inplace(asset_backfill_data.target_subset)
 
-        return result
+        return result_builder.build()
 
     ####################
     # PARTITIONS
@@ -25,7 +25,10 @@
 )
 from dagster._core.definitions.asset_check_spec import AssetCheckSpec
 from dagster._core.definitions.asset_graph import AssetGraph
-from dagster._core.definitions.asset_graph_subset import AssetGraphSubset
+from dagster._core.definitions.asset_graph_subset import (
+    AssetGraphSubset,
+    AssetGraphSubsetBuilder,
+)
 from dagster._core.definitions.decorators.asset_check_decorator import asset_check
 from dagster._core.definitions.events import AssetKeyPartitionKey
 from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
@@ -33,6 +36,11 @@
 from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.partition_mapping import UpstreamPartitionsResult
 from dagster._core.definitions.source_asset import SourceAsset
+from dagster._core.definitions.time_window_partitions import (
+    PartitionKeysTimeWindowPartitionsSubset,
+    TimeWindowPartitionsDefinition,
+    TimeWindowPartitionsSubset,
+)
 from dagster._core.errors import (
     DagsterDefinitionChangedDeserializationError,
 )
@@ -42,6 +50,7 @@
 )
 from dagster._core.instance import DynamicPartitionsStore
 from dagster._core.test_utils import instance_for_test
+from dagster._serdes import deserialize_value, serialize_value
 from dagster._seven.compat.pendulum import create_pendulum_time
 
 
@@ -563,6 +572,37 @@ def unpartitioned2():
     assert partitioned2.key not in asset_graph_subset
     assert AssetKeyPartitionKey(partitioned2.key, "2022-01-01") not in asset_graph_subset
 
+    # empty partitions subsets are not stored
+    assert asset_graph_subset.partitions_subsets_by_asset_key.keys() == {partitioned1.key}
+    assert asset_graph_subset.asset_keys == {partitioned1.key, unpartitioned1.key}
+
+    assert set(asset_graph_subset.iterate_asset_partitions()) == {
+        AssetKeyPartitionKey(partitioned1.key, "2022-01-01"),
+        AssetKeyPartitionKey(unpartitioned1.key),
+    }
+
+
+def test_asset_graph_subset_filter_asset_keys_keeps_order():
+    static_partitions_def = StaticPartitionsDefinition(["a", "b"])
+    asset_keys = [AssetKey(f"partitioned{i}") for i in range(20)]
+    asset_graph_subset = AssetGraphSubset(
+        partitions_subsets_by_asset_key={
+            asset_key: static_partitions_def.subset_with_partition_keys(["a"])
+            for asset_key in asset_keys
+        },
+    )
+
+    for filter_keys in [
+        asset_keys[5:6],
+        asset_keys[3:15:2],
+        [*asset_keys, AssetKey("unknown")],
+        [AssetKey("unknown")],
+    ]:
+        filtered = asset_graph_subset.filter_asset_keys(set(filter_keys))
+        assert list(filtered.partitions_subsets_by_asset_key) == [
+            asset_key for asset_key in asset_keys if asset_key in filter_keys
+        ]
+
 
 def test_asset_graph_difference(asset_graph_from_assets):
     daily_partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
@@ -609,6 +649,7 @@ def unpartitioned2():
 
     assert len(list((subset1 - subset1).iterate_asset_partitions())) == 0
     assert len(list((subset2 - subset2).iterate_asset_partitions())) == 0
+    assert subset1 - subset1 == AssetGraphSubset()
     assert subset1 - subset2 == AssetGraphSubset(
         partitions_subsets_by_asset_key={
             partitioned1.key: daily_partitions_def.subset_with_partition_keys(["2022-01-01"]),
@@ -627,6 +668,184 @@ def unpartitioned2():
     )
 
 
+def test_asset_graph_subset_operators_share_unchanged_fields():
+    static_partitions_def = StaticPartitionsDefinition(["a", "b"])
+    a_subset = static_partitions_def.subset_with_partition_keys(["a"])
+    partitioned_keys = [AssetKey(f"partitioned{i}") for i in range(100)]
+    big = AssetGraphSubset(
+        partitions_subsets_by_asset_key={key: a_subset for key in partitioned_keys},
+        non_partitioned_asset_keys={AssetKey("unpartitioned1"), AssetKey("unpartitioned2")},
+    )
+    small_non_partitioned = AssetGraphSubset(
+        non_partitioned_asset_keys={AssetKey("unpartitioned1")}
+    )
+    small_partitioned = AssetGraphSubset(
+        partitions_subsets_by_asset_key={AssetKey("other_partitioned"): a_subset}
+    )
+
+    # a small non-partitioned other leaves self's mapping untouched
+    union = big | small_non_partitioned
+    assert union.partitions_subsets_by_asset_key is big.partitions_subsets_by_asset_key
+    assert union.non_partitioned_asset_keys == big.non_partitioned_asset_keys
+
+    difference = big - small_non_partitioned
+    assert difference.partitions_subsets_by_asset_key is big.partitions_subsets_by_asset_key
+    assert difference.non_partitioned_asset_keys == {AssetKey("unpartitioned2")}
+
+    intersection = big & small_non_partitioned
+    assert intersection.partitions_subsets_by_asset_key == {}
+    assert intersection.non_partitioned_asset_keys == {AssetKey("unpartitioned1")}
+
+    # an other without non-partitioned keys leaves self's set untouched
+    union = big | small_partitioned
+    assert union.non_partitioned_asset_keys is big.non_partitioned_asset_keys
+    assert union.partitions_subsets_by_asset_key.keys() == {
+        *partitioned_keys,
+        AssetKey("other_partitioned"),
+    }
+
+    difference = big - small_partitioned
+    assert difference.non_partitioned_asset_keys is big.non_partitioned_asset_keys
+    assert difference.partitions_subsets_by_asset_key is big.partitions_subsets_by_asset_key
+
+
+def test_asset_graph_intersection(asset_graph_from_assets):
+    daily_partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+
+    @asset(partitions_def=daily_partitions_def)
+    def partitioned1():
+        ...
+
+    @asset(partitions_def=daily_partitions_def)
+    def partitioned2():
+        ...
+
+    @asset
+    def unpartitioned1():
+        ...
+
+    @asset
+    def unpartitioned2():
+        ...
+
+    subset1 = AssetGraphSubset(
+        partitions_subsets_by_asset_key={
+            partitioned1.key: daily_partitions_def.subset_with_partition_keys(
+                ["2022-01-01", "2022-01-02", "2022-01-03"]
+            ),
+            partitioned2.key: daily_partitions_def.subset_with_partition_keys(
+                ["2022-01-01", "2022-01-02"]
+            ),
+        },
+        non_partitioned_asset_keys={unpartitioned1.key, unpartitioned2.key},
+    )
+
+    subset2 = AssetGraphSubset(
+        partitions_subsets_by_asset_key={
+            partitioned1.key: daily_partitions_def.subset_with_partition_keys(
+                ["2022-01-02", "2022-01-03", "2022-01-04"]
+            ),
+        },
+        non_partitioned_asset_keys={unpartitioned2.key},
+    )
+
+    expected = AssetGraphSubset(
+        partitions_subsets_by_asset_key={
+            partitioned1.key: daily_partitions_def.subset_with_partition_keys(
+                ["2022-01-02", "2022-01-03"]
+            ),
+        },
+        non_partitioned_asset_keys={unpartitioned2.key},
+    )
+    assert subset1 & subset2 == expected
+    assert subset2 & subset1 == expected
+    assert subset1 & AssetGraphSubset() == AssetGraphSubset()
+
+
+def test_asset_graph_subset_builder():
+    daily_partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+    partitioned_key = AssetKey("partitioned")
+    unpartitioned_key = AssetKey("unpartitioned")
+
+    subsets = [
+        AssetGraphSubset(
+            partitions_subsets_by_asset_key={
+                partitioned_key: daily_partitions_def.subset_with_partition_keys(["2022-01-01"])
+            },
+        ),
+        AssetGraphSubset(non_partitioned_asset_keys={unpartitioned_key}),
+        AssetGraphSubset(),
+        AssetGraphSubset(
+            partitions_subsets_by_asset_key={
+                partitioned_key: daily_partitions_def.subset_with_partition_keys(
+                    ["2022-01-02", "2022-01-03"]
+                )
+            },
+        ),
+    ]
+
+    builder = AssetGraphSubsetBuilder()
+    assert builder.build() == AssetGraphSubset()
+
+    # initial contents are taken as given, except that empty subsets are dropped
+    initial_subsets_by_asset_key = {
+        partitioned_key: daily_partitions_def.subset_with_partition_keys(["2022-01-05"]),
+        AssetKey("empty"): daily_partitions_def.empty_subset(),
+    }
+    assert AssetGraphSubsetBuilder(
+        partitions_subsets_by_asset_key=initial_subsets_by_asset_key,
+        non_partitioned_asset_keys={unpartitioned_key},
+    ).build() == AssetGraphSubset(
+        partitions_subsets_by_asset_key={
+            partitioned_key: initial_subsets_by_asset_key[partitioned_key]
+        },
+        non_partitioned_asset_keys={unpartitioned_key},
+    )
+
+    expected = AssetGraphSubset()
+    for subset in subsets:
+        builder.union_inplace(subset)
+        expected = expected | subset
+    built = builder.build()
+    assert built == expected
+
+    # Further unions must not mutate subsets that have already been built
+    builder.union_inplace(
+        AssetGraphSubset(non_partitioned_asset_keys={AssetKey("other_unpartitioned")})
+    )
+    assert built == expected
+    assert builder.build() == expected | AssetGraphSubset(
+        non_partitioned_asset_keys={AssetKey("other_unpartitioned")}
+    )
+
+
+def test_asset_graph_subset_serdes():
+    time_window_partitions_def = TimeWindowPartitionsDefinition(
+        start=datetime(2022, 1, 1), cron_schedule="0 0 * * *", fmt="%Y-%m-%d"
+    )
+    static_partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+    partition_keys_subset = time_window_partitions_def.empty_subset().with_partition_keys(
+        ["2022-01-01", "2022-01-02"]
+    )
+    assert isinstance(partition_keys_subset, PartitionKeysTimeWindowPartitionsSubset)
+
+    asset_graph_subset = AssetGraphSubset(
+        partitions_subsets_by_asset_key={
+            AssetKey("partitioned1"): partition_keys_subset,
+            AssetKey("partitioned2"): static_partitions_def.subset_with_partition_keys(["a"]),
+        },
+        non_partitioned_asset_keys={AssetKey("unpartitioned")},
+    )
+
+    deserialized = deserialize_value(serialize_value(asset_graph_subset), AssetGraphSubset)
+    assert deserialized == asset_graph_subset
+    assert isinstance(
+        deserialized.partitions_subsets_by_asset_key[AssetKey("partitioned1")],
+        TimeWindowPartitionsSubset,
+    )
+
+
 def test_asset_graph_partial_deserialization(asset_graph_from_assets):
     daily_partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
     static_partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
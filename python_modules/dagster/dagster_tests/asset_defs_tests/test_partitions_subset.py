@@ -188,3 +188,54 @@ def test_all_partitions_subset_time_window_partitions_def() -> None:
         assert subset - all_subset == PartitionKeysTimeWindowPartitionsSubset(
             time_window_partitions_def, included_partition_keys=set()
         )
+
+
+def test_partitions_subset_is_empty() -> None:
+    static_partitions_def = StaticPartitionsDefinition(["a", "b"])
+    assert static_partitions_def.empty_subset().is_empty
+    assert not static_partitions_def.subset_with_partition_keys(["a"]).is_empty
+    assert not AllPartitionsSubset(static_partitions_def, Mock(), pendulum.now("UTC")).is_empty
+
+    with pendulum.test(create_pendulum_time(2020, 1, 6, hour=10)):
+        future_partitions_def = DailyPartitionsDefinition(start_date="2020-02-01")
+        assert AllPartitionsSubset(future_partitions_def, Mock(), pendulum.now("UTC")).is_empty
+
+
+def test_default_partitions_subset_union_and_intersection() -> None:
+    abc_subset = DefaultPartitionsSubset({"a", "b", "c"})
+    cd_subset = DefaultPartitionsSubset({"c", "d"})
+    assert abc_subset | cd_subset == DefaultPartitionsSubset({"a", "b", "c", "d"})
+    assert abc_subset & cd_subset == DefaultPartitionsSubset({"c"})
+    assert abc_subset & DefaultPartitionsSubset() == DefaultPartitionsSubset()
+
+
+@pytest.mark.parametrize(
+    "partition_keys, other_partition_keys",
+    [
+        ([], []),
+        (["2023-01-01", "2023-01-02"], []),
+        (["2023-01-01", "2023-01-02"], ["2023-01-03", "2023-01-04"]),
+        (["2023-01-01", "2023-01-02"], ["2023-01-05"]),
+        (["2023-01-01", "2023-01-03", "2023-01-05"], ["2023-01-02", "2023-01-03", "2023-01-04"]),
+        (["2023-01-02", "2023-01-03", "2023-01-04"], ["2023-01-01", "2023-01-03", "2023-01-05"]),
+        (["2023-01-01", "2023-01-02", "2023-01-06", "2023-01-07"], ["2023-01-02", "2023-01-06"]),
+    ],
+)
+def test_time_window_partitions_subset_union_and_intersection(
+    partition_keys, other_partition_keys
+) -> None:
+    partitions_def = DailyPartitionsDefinition(start_date="2023-01-01")
+    empty_subset = TimeWindowPartitionsSubset.empty_subset(partitions_def)
+    subset = empty_subset.with_partition_keys(partition_keys)
+    other_subset = empty_subset.with_partition_keys(other_partition_keys)
+
+    for result, expected_partition_keys in [
+        (subset | other_subset, set(partition_keys) | set(other_partition_keys)),
+        (other_subset | subset, set(partition_keys) | set(other_partition_keys)),
+        (subset & other_subset, set(partition_keys) & set(other_partition_keys)),
+        (other_subset & subset, set(partition_keys) & set(other_partition_keys)),
+    ]:
+        assert isinstance(result, TimeWindowPartitionsSubset)
+        assert result == empty_subset.with_partition_keys(expected_partition_keys)
+        assert set(result.get_partition_keys()) == expected_partition_keys
+        assert len(result) == len(expected_partition_keys)